@@ -20,14 +20,12 @@ Rose Picker program script. Execution starts here.
 """
 
 from argparse import ArgumentParser
-import collections
 import json
 import os.path
 from pathlib import Path
 import re
 from typing import Dict, List, Sequence
 
-import rose_picker.rose  # type: ignore
 from rose_picker.rose.config import ConfigSyntaxError  # type: ignore
 from rose_picker.rose.config_tree import (  # type: ignore
     ConfigTree,
@@ -36,6 +34,21 @@ from rose_picker.rose.config_tree import (  # type: ignore
 
 _NAMELISTS_REGEX = re.compile(r"^\s*namelist\s*:\s*(\w*)\s*(?:=\s*(\S+))?")
 
+_NAMELIST_KEYS = ("duplicate", "instance_key_member")
+
+_NAMELIST_KEY_NAMES = {"duplicate": "multiple_instances_allowed"}
+
+_MEMBER_KEYS = (
+    "bounds",
+    "enumeration",
+    "expression",
+    "kind",
+    "length",
+    "string_length",
+    "type",
+    "values",
+)
+
 
 class RosePickerException(Exception):
     """
@@ -49,32 +62,37 @@ def _load_configuration(filename: Path, include_dirs: Sequence[Path]) -> ConfigT
     """
     Load and expand the configuration file.
     """
-    if not filename.exists():
-        raise RosePickerException(f"File {filename} does not exist.")
+    # An absolute directory stops the loader searching the include
+    # directories for the top-level file. Symlinks are left unresolved so
+    # imports are found relative to the directory as given.
+    conf_dir = Path(os.path.abspath(filename.parent))
     try:
-        config_node = rose_picker.rose.config.load(str(filename))
         tree_loader = ConfigTreeLoader()
 
-        tree_loader.load(
-            filename.parent,
+        config_tree = tree_loader.load(
+            conf_dir,
             filename.name,
             conf_dir_paths=include_dirs,
-            conf_node=config_node,
         )
-        return config_node
+        return config_tree.node
+    except FileNotFoundError as not_found:
+        missing = not_found.filename
+        if missing == str(conf_dir / filename.name):
+            missing = filename
+        raise RosePickerException(f"File {missing} does not exist.") from not_found
     except ConfigSyntaxError as config_syntax:
         raise RosePickerException(
             f"File {filename} is not a valid rose meta configuration file."
         ) from config_syntax
 
 
-def _list_configuration(config_node: ConfigTree) -> List[str]:
+def _list_configuration(config_node: ConfigTree) -> List[re.Match[str]]:
     """
-    Get keys list of all the namelists/members in the configuration file.
+    Get matches for all the namelists/members in the configuration file,
+    sorted by key.
     """
-    node_keys = list(filter(_NAMELISTS_REGEX.match, config_node.get_value().keys()))
-    node_keys.sort()
-    return node_keys
+    matches = map(_NAMELISTS_REGEX.match, config_node.get_value().keys())
+    return sorted(filter(None, matches), key=lambda match: match.string)
 
 
 def _extract_namelists(
@@ -89,12 +107,7 @@ def _extract_namelists(
     """
     Extracts namelist properties from meta-data.
     """
-    node_keys = _list_configuration(config_node)
-
-    for key in node_keys:
-        match = _NAMELISTS_REGEX.match(key)
-        if match is None:
-            raise Exception(f"Failed to find key in string: {key}")
+    for match in _list_configuration(config_node):
         node = match.group(0)
         namelist = match.group(1)
         member = match.group(2)
@@ -102,43 +115,30 @@ def _extract_namelists(
         if namelist:
             if not member:  # pylint: disable=no-else-continue
                 listnames.append(namelist)
-                namelist_config[namelist] = {}
-                namelist_config[namelist]["members"] = {}
+                list_config = namelist_config[namelist] = {"members": {}}
 
-                list_node = config_node.get([node])
-                list_node_keys = list_node.get_value().keys()
+                list_props = config_node.get_value([node])
 
                 for i in namelist_keys:
-                    if i in list_node_keys:
-                        list_prop = list_node.get([i])
-                        list_prop = list_prop.get_value()
-
-                        if i == "duplicate":
-                            KEY = "multiple_instances_allowed"
-                            namelist_config[namelist][KEY] = list_prop
-                        else:
-                            namelist_config[namelist][i] = list_prop
+                    if i in list_props:
+                        list_prop = list_props[i].get_value()
+                        list_config[_NAMELIST_KEY_NAMES.get(i, i)] = list_prop
 
                 continue
 
-            elif namelist not in namelist_config.keys():
-                message = (
-                    "namelist:"
-                    + namelist
-                    + " has no section in metadata configuration file"
+            elif namelist not in namelist_config:
+                raise RosePickerException(
+                    f"namelist:{namelist} has no section in metadata configuration file"
                 )
-                raise RosePickerException(message)
 
             else:
-                namelist_config[namelist]["members"][member] = {}
+                member_config = namelist_config[namelist]["members"][member] = {}
 
-                member_node = config_node.get([node])
-                member_node_keys = member_node.get_value().keys()
+                member_props = config_node.get_value([node])
                 for i in member_keys:
-                    if i in member_node_keys:
-                        member_prop = member_node.get([i])
-                        member_prop = member_prop.get_value()
-                        namelist_config[namelist]["members"][member][i] = member_prop
+                    if i in member_props:
+                        member_prop = member_props[i].get_value()
+                        member_config[i] = member_prop
 
 
 def main(meta_filename: Path, include_dirs: Sequence[Path], output_dir: Path):
@@ -154,38 +154,24 @@ def main(meta_filename: Path, include_dirs: Sequence[Path], output_dir: Path):
     """
     config_node = _load_configuration(meta_filename, include_dirs)
 
-    namelist_keys = ["duplicate", "instance_key_member"]
-
-    member_keys = [
-        "bounds",
-        "enumeration",
-        "expression",
-        "kind",
-        "length",
-        "string_length",
-        "type",
-        "values",
-    ]
-
     listnames: List[str] = []
-    namelist_config: Dict[str, Dict[str, Dict[str, Dict[str, str]]]] = (
-        collections.OrderedDict()
-    )
+    namelist_config: Dict[str, Dict[str, Dict[str, Dict[str, str]]]] = {}
     _extract_namelists(
-        config_node, namelist_keys, member_keys, listnames, namelist_config
+        config_node, _NAMELIST_KEYS, _MEMBER_KEYS, listnames, namelist_config
     )
 
-    basename = os.path.basename(meta_filename).split(".")
+    basename = meta_filename.name.split(".")
 
     # Output as .json file
-    nml_config_filename = f"{basename[0]}.json"
-    with open(f"{output_dir}/{nml_config_filename}", "wt", encoding="utf-8") as output:
+    nml_config_filename = output_dir / f"{basename[0]}.json"
+    with nml_config_filename.open("wt", encoding="utf-8") as output:
         json.dump(namelist_config, output, indent=4, ensure_ascii=True)
 
     # Write out namelists in configuration
-    with open(f"{output_dir}/config_namelists.txt", "wt", encoding="utf-8") as output:
-        for listname in listnames:
-            output.write(f"{listname}\n")
+    namelists_filename = output_dir / "config_namelists.txt"
+    namelists_filename.write_text(
+        "".join(f"{listname}\n" for listname in listnames), encoding="utf-8"
+    )
 
 
 def cli() -> None:
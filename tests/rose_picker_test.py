@@ -18,7 +18,6 @@
 Functional tests of rose-picker tool.
 """
 
-import collections
 import json
 from pathlib import Path
 from subprocess import run, PIPE
@@ -48,6 +47,77 @@ type=integer
     assert expected in str(process.stderr)
 
 
+###############################################################################
+def test_missing_file(tmp_path: Path):
+    """
+    Confirms that a metadata file which does not exist is reported.
+    """
+    command: List[str] = [str(PICKER_EXE), "missing.conf"]
+    process = run(command, cwd=tmp_path, stderr=PIPE, check=False)
+    assert process.returncode != 0
+
+    expected = "RosePickerException: File missing.conf does not exist."
+    assert expected in str(process.stderr)
+
+
+###############################################################################
+def test_missing_file_not_searched(tmp_path: Path):
+    """
+    Confirms that a missing metadata file is not replaced by one with the same
+    relative path in an include directory.
+    """
+    include_file = tmp_path / "include/meta/rose-meta.conf"
+    include_file.parent.mkdir(parents=True)
+    include_file.write_text("\n[namelist:aerial]\n")
+
+    work_dir = tmp_path / "work"
+    work_dir.mkdir()
+
+    command: List[str] = [
+        str(PICKER_EXE),
+        "meta/rose-meta.conf",
+        "-include_dirs",
+        str(include_file.parent.parent),
+    ]
+    process = run(command, cwd=work_dir, stderr=PIPE, check=False)
+    assert process.returncode != 0
+
+    expected = "File meta/rose-meta.conf does not exist."
+    assert expected in str(process.stderr)
+    assert not (work_dir / "rose-meta.json").exists()
+
+
+###############################################################################
+def test_symlinked_metadata_directory(tmp_path: Path):
+    """
+    Confirms that imports are found relative to a symlinked metadata
+    directory rather than its target.
+    """
+    real_dir = tmp_path / "real/app"
+    real_dir.mkdir(parents=True)
+    (real_dir / "rose-meta.conf").write_text("""
+import=meta-base
+
+[namelist:aerial]
+""")
+
+    suite_dir = tmp_path / "suite"
+    (suite_dir / "meta-base").mkdir(parents=True)
+    (suite_dir / "meta-base/rose-meta.conf").write_text("""
+[namelist:sugar]
+""")
+    (suite_dir / "app").symlink_to(real_dir)
+
+    command: List[str] = [str(PICKER_EXE), "app/rose-meta.conf"]
+    process = run(command, cwd=suite_dir, check=False)
+    assert process.returncode == 0
+
+    with (suite_dir / "rose-meta.json").open() as fhandle:
+        result = json.load(fhandle)
+
+    assert result == {"aerial": {"members": {}}, "sugar": {"members": {}}}
+
+
 ###############################################################################
 def test_good_picker(tmp_path: Path):
     """
@@ -94,33 +164,85 @@ length=:
     with output_file.open() as fhandle:
         result = json.load(fhandle)
 
-    good_result = collections.OrderedDict(
-        {
-            "aerial": {
-                "members": {
-                    "dino": {
-                        "length": ":",
-                        "type": "integer",
-                        "bounds": "namelist:sugar=TABLET",
-                    },
-                    "wilma": {
-                        "length": ":",
-                        "type": "real",
-                        "bounds": "source:constants_mod=FUDGE",
-                    },
-                    "betty": {"length": ":", "type": "logical", "bounds": "fred"},
-                    "bambam": {"length": ":", "type": "integer"},
-                    "fred": {"type": "real"},
-                    "barney": {"type": "character"},
+    good_result = {
+        "aerial": {
+            "members": {
+                "dino": {
+                    "length": ":",
+                    "type": "integer",
+                    "bounds": "namelist:sugar=TABLET",
+                },
+                "wilma": {
+                    "length": ":",
+                    "type": "real",
+                    "bounds": "source:constants_mod=FUDGE",
                 },
-                "multiple_instances_allowed": "true",
-                "instance_key_member": "betty",
-            }
+                "betty": {"length": ":", "type": "logical", "bounds": "fred"},
+                "bambam": {"length": ":", "type": "integer"},
+                "fred": {"type": "real"},
+                "barney": {"type": "character"},
+            },
+            "multiple_instances_allowed": "true",
+            "instance_key_member": "betty",
         }
-    )
+    }
 
     assert result == good_result
 
+    # namelist list
+    namelists_file = input_file.parent / "config_namelists.txt"
+    assert namelists_file.read_text() == "aerial\n"
+
+
+###############################################################################
+def test_imported_picker(tmp_path: Path):
+    """
+    Confirms that imported metadata is merged, with the importing file taking
+    precedence.
+    """
+    input_file = tmp_path / "input/rose-meta.conf"
+    input_file.parent.mkdir()
+    input_file.write_text("""
+import=base
+
+[namelist:aerial]
+
+[namelist:aerial=fred]
+type=real
+""")
+
+    base_file = tmp_path / "include/base/rose-meta.conf"
+    base_file.parent.mkdir(parents=True)
+    base_file.write_text("""
+[namelist:aerial=fred]
+type=integer
+length=:
+
+[namelist:sugar]
+
+[namelist:sugar=tablet]
+type=logical
+""")
+
+    command: List[str] = [
+        str(PICKER_EXE),
+        str(input_file),
+        "-directory",
+        str(tmp_path),
+        "-include_dirs",
+        str(base_file.parent.parent),
+    ]
+    process = run(command, check=False)
+    assert process.returncode == 0
+
+    with (tmp_path / "rose-meta.json").open() as fhandle:
+        result = json.load(fhandle)
+
+    assert result == {
+        "aerial": {"members": {"fred": {"length": ":", "type": "real"}}},
+        "sugar": {"members": {"tablet": {"type": "logical"}}},
+    }
+
 
 ###############################################################################
 def test_full_commandline(tmp_path: Path):